@@ -1,23 +1,176 @@
 
 # Base Data Object
 
-import uuid
-import json
+import contextvars
+import functools
+import logging
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import orjson
+from cachetools import TTLCache
+
+
+# cache key prefixes ('<table>_uuid=') computed once per table; keys stay str
+# (not bytes) because the cache driver only accepts str keys
+_cache_key_prefixes = {}
+
+
+@functools.lru_cache(maxsize=8192)
+def _construct_cache_key(table_name, uuid):
+	# module-level helper so lru_cache composes cleanly (it doesn't play well
+	# with classmethods directly); bounded so hot uuids become dict lookups
+	# without the cache growing unchecked. On a miss, the key is a single
+	# concat onto the precomputed table prefix rather than a format-string
+	# parse.
+	prefix = _cache_key_prefixes.get(table_name)
+	if prefix is None:
+		prefix = table_name + '_uuid='
+		_cache_key_prefixes[table_name] = prefix
+	return prefix + uuid
+
+
+# memoized (db_driver, cache_driver) default pairs keyed by data object class,
+# so the default-driver resolution only runs once per class
+_default_drivers = {}
+_default_drivers_lock = threading.Lock()
+
+
+def _get_drivers(cls, db_driver=None, cache_driver=None):
+	# return drivers if they exist otherwise, retrieve from defaults set on
+	# subclass (resolved once per class and memoized). Module-level so the
+	# hot classmethods skip the bound-method descriptor lookup per call.
+	if db_driver is not None and cache_driver is not None:
+		return db_driver, cache_driver
+	defaults = _default_drivers.get(cls)
+	if defaults is None:
+		with _default_drivers_lock:
+			defaults = _default_drivers.get(cls)
+			if defaults is None:
+				defaults = (
+					cls.DEFAULT_DB_DRIVER,
+					cls.DEFAULT_CACHE_DRIVER
+				)
+				_default_drivers[cls] = defaults
+	db_driver = db_driver if db_driver is not None else defaults[0]
+	cache_driver = (
+		cache_driver if cache_driver is not None
+		else defaults[1]
+	)
+	return db_driver, cache_driver
+
+
+# request-scoped identity map holding (class, uuid) -> instance; None outside
+# an identity_map() block, in which case find_one behaves as before
+_identity_map = contextvars.ContextVar('identity_map', default=None)
+
+
+@contextmanager
+def identity_map():
+	"""
+	Context manager establishing a request-scoped identity map. Within the
+	block, repeat find_one lookups for the same uuid return the already
+	instantiated data object without another cache or database roundtrip.
+	Intended to wrap a unit of work such as a single API request.
+
+	"""
+
+	token = _identity_map.set({})
+	try:
+		yield
+	finally:
+		_identity_map.reset(token)
+
+
+# background pool for post-query cache warming, so find_many callers don't
+# block on the cache roundtrip (the Redis client is thread-safe)
+_cache_warm_pool = ThreadPoolExecutor(max_workers=4)
+
+
+def _log_cache_warm_failure(future):
+	# the warming Future is otherwise discarded, so surface any exception
+	# from the background cache write instead of letting it vanish
+	exc = future.exception()
+	if exc is not None:
+		logging.getLogger(__name__).warning(
+			'background cache warm failed: %r',
+			exc
+		)
+
+
+# memoized table field names keyed by table name; table schemas don't change
+# at runtime, so the DESC roundtrip only ever needs to happen once per table
+_table_field_names = {}
+
+
+# in-process L1 cache in front of the remote cache driver. Populated
+# write-through on cache sets only (entry TTLs are known there), so a local
+# hit can never outlive the remote entry. Entries store
+# (expiry timestamp, orjson-encoded cache value) - per-entry TTLs are usually
+# shorter than the local cache's own bound, and encoding puts the local cache
+# on the same copy boundary as the remote one (which JSON-roundtrips values),
+# so a hit can never hand out live references into another instance's dicts.
+_local_cache = TTLCache(maxsize=10000, ttl=60)
+_local_cache_lock = threading.Lock()
+
+
+def _local_cache_set(cache_key, cache_value, ttl):
+	with _local_cache_lock:
+		_local_cache[cache_key] = (
+			time.time() + ttl,
+			orjson.dumps(cache_value)
+		)
+
+
+def _local_cache_get(cache_key):
+	with _local_cache_lock:
+		entry = _local_cache.get(cache_key)
+		if entry is None:
+			return None
+		expires_at, cache_value = entry
+		if expires_at <= time.time():
+			del _local_cache[cache_key]
+			return None
+	return orjson.loads(cache_value)
+
+
+def _local_cache_delete(cache_key):
+	with _local_cache_lock:
+		_local_cache.pop(cache_key, None)
 
 
 class BaseDataObject():
 	"""
 	Provides base methods and interface for all proper data objects.
 
+	NOTE: Instances are slotted to avoid a per-instance __dict__ (find_many
+	can return thousands of instances). Subclasses which add no instance
+	attributes should declare '__slots__ = ()' to preserve the optimization.
+
 	TODO:
 		- add and update docstrings
 		- asses types of caching currently implemented and research
 			alternatives
 		- better management of attribute types (int, str, bool, etc.)
+		- evaluate AOT-compiling this module (mypyc/Cython) if the server
+			image ever gains a build step; instance construction is the
+			remaining interpreter-bound cost on large find_many results
 
 	"""
 
 
+	__slots__ = (
+		'properties',
+		'metadata',
+		'new_record',
+		'db_driver',
+		'cache_driver'
+	)
+
+
 	# attributes require by subclasses (not used, for documentation only)
 	REQUIRED_SUBCLASS_ATTRIBUTES = [
 		'TABLE_NAME',
@@ -32,16 +185,16 @@ class BaseDataObject():
 	# metadata
 	CREATED_TS_METADATA = 'created_ts'
 	UPDATED_TS_METADATA = 'updated_ts'
-	METADATA_FIELDS = [
+	METADATA_FIELDS = frozenset({
 		CREATED_TS_METADATA,
 		UPDATED_TS_METADATA
-	]
+	})
 
 
 	def __init__(
 		self,
 		prop_dict,
-		metadata_dict={},
+		metadata_dict=None,
 		new_record=True,
 		db_driver=None,
 		cache_driver=None
@@ -61,25 +214,29 @@ class BaseDataObject():
 
 		"""
 
+		if metadata_dict is None:
+			metadata_dict = {}
+
 		# set properties
 		self.properties = prop_dict
 
-		# set metadata initial values
+		# set metadata values in a single dict allocation (fields absent from
+		# the passed dict default to None)
 		self.metadata = {
-			self.CREATED_TS_METADATA: None,
-			self.UPDATED_TS_METADATA: None
+			self.CREATED_TS_METADATA: metadata_dict.get(
+				self.CREATED_TS_METADATA
+			),
+			self.UPDATED_TS_METADATA: metadata_dict.get(
+				self.UPDATED_TS_METADATA
+			)
 		}
 
-		# replace metadata initial values with passed values
-		for key, val in metadata_dict.items():
-			if key in self.METADATA_FIELDS:
-				self.metadata[key] = val
-
 		# set new_record attribute
 		self.new_record = new_record
 
 		# set database driver and cache driver
-		self.db_driver, self.cache_driver = self.get_drivers(
+		self.db_driver, self.cache_driver = _get_drivers(
+			type(self),
 			db_driver=db_driver,
 			cache_driver=cache_driver
 		)
@@ -91,7 +248,7 @@ class BaseDataObject():
 	@classmethod
 	def create(
 		cls,
-		prop_dict={},
+		prop_dict=None,
 		db_driver=None,
 		cache_driver=None
 	):
@@ -108,8 +265,14 @@ class BaseDataObject():
 
 		"""
 
-		# set uuid upon dataobject creation
-		prop_dict[cls.UUID_PROPERTY] = uuid.uuid4().hex
+		# copy the passed properties so the caller's dict is never mutated by
+		# the uuid assignment below
+		prop_dict = dict(prop_dict) if prop_dict is not None else {}
+
+		# set uuid upon dataobject creation (a 128-bit random hex token, not
+		# an RFC 4122 UUID; same 32-char format without constructing and
+		# formatting a UUID object)
+		prop_dict[cls.UUID_PROPERTY] = secrets.token_hex(16)
 
 		# use the constructor to set properties, DB driver and cache driver
 		return cls(
@@ -122,11 +285,12 @@ class BaseDataObject():
 	@classmethod
 	def find_many(
 		cls,
-		prop_dict={},
+		prop_dict=None,
 		limit=None,
 		db_driver=None,
 		cache_driver=None,
-		cache_ttl=None
+		cache_ttl=None,
+		warm_cache=True
 	):
 		"""
 		Data object database search method. Search for multiple records matching
@@ -138,13 +302,19 @@ class BaseDataObject():
 			db_driver (object): Database driver.
 			cache_driver (object): Cache driver.
 			cache_ttl (int): Cache time-to-live in seconds.
+			warm_cache (bool): Cache found instances on a background thread;
+				when False the cache set happens synchronously instead.
 
 		Returns:
 			(list) List of data object instances.
 
 		"""
 
-		db_driver, cache_driver = cls.get_drivers(
+		if prop_dict is None:
+			prop_dict = {}
+
+		db_driver, cache_driver = _get_drivers(
+			cls,
 			db_driver=db_driver,
 			cache_driver=cache_driver
 		)
@@ -179,14 +349,35 @@ class BaseDataObject():
 			records_are_new=False
 		)
 
-		# batch cache database found instances on the way out
+		# batch cache database found instances on the way out, in the
+		# background by default so the caller isn't blocked on the cache write
 		if len(instances) > 0:
-			cls.set_batch_to_cache(
-				dataobjects=instances,
-				db_driver=db_driver,
-				cache_driver=cache_driver,
-				ttl=cache_ttl
-			)
+			if warm_cache:
+				# serialize synchronously - the payloads carry no live
+				# instance state, so caller mutations after find_many
+				# returns can't race into the cached values - and defer only
+				# the cache write itself
+				cache_key_to_value, cache_key_to_uuid = (
+					cls.__build_cache_batch(dataobjects=instances)
+				)
+				warm_future = _cache_warm_pool.submit(
+					cls.__write_cache_batch,
+					cache_key_to_value=cache_key_to_value,
+					cache_key_to_uuid=cache_key_to_uuid,
+					cache_driver=cache_driver,
+					ttl=(
+						cache_ttl if cache_ttl is not None
+						else cls.DEFAULT_CACHE_TTL
+					)
+				)
+				warm_future.add_done_callback(_log_cache_warm_failure)
+			else:
+				cls.set_batch_to_cache(
+					dataobjects=instances,
+					db_driver=db_driver,
+					cache_driver=cache_driver,
+					ttl=cache_ttl
+				)
 
 		return instances
 
@@ -194,7 +385,7 @@ class BaseDataObject():
 	@classmethod
 	def find_one(
 		cls,
-		prop_dict={},
+		prop_dict=None,
 		db_driver=None,
 		cache_driver=None,
 		cache_ttl=None
@@ -214,31 +405,98 @@ class BaseDataObject():
 
 		"""
 
-		instance_list = cls.find_many(
-			prop_dict=prop_dict,
-			limit=1,
+		if prop_dict is None:
+			prop_dict = {}
+
+		db_driver, cache_driver = _get_drivers(
+			cls,
 			db_driver=db_driver,
-			cache_driver=cache_driver,
-			cache_ttl=cache_ttl
+			cache_driver=cache_driver
 		)
 
-		if len(instance_list) > 0:
-			return instance_list[0]
-		else:
+		# only check identity map and cache if finding solely by single uuid
+		imap = _identity_map.get()
+		find_props = list(prop_dict.keys())
+		find_uuid = None
+		if (
+			len(find_props) == 1 and
+			find_props[0] == cls.UUID_PROPERTY and
+			type(prop_dict[cls.UUID_PROPERTY]) is str
+		):
+			find_uuid = prop_dict[cls.UUID_PROPERTY]
+
+		if find_uuid is not None:
+			# repeat lookups within an identity-map scope return the already
+			# instantiated object with no roundtrip at all
+			if imap is not None:
+				instance = imap.get((cls, find_uuid))
+				if instance is not None:
+					return instance
+			instance = cls.load_from_cache_by_uuid(
+				uuid=find_uuid,
+				db_driver=db_driver,
+				cache_driver=cache_driver
+			)
+			if instance is not None:
+				if imap is not None:
+					imap[(cls, find_uuid)] = instance
+				return instance
+
+		# fetch a single record directly instead of building a result list
+		# through find_many
+		record = db_driver.find_one_by_fields(
+			table_name=cls.TABLE_NAME,
+			where_props=prop_dict
+		)
+		if record is None:
 			return None
 
+		instance = cls.load_database_records(
+			records=[record],
+			db_driver=db_driver,
+			cache_driver=cache_driver,
+			records_are_new=False
+		)[0]
+
+		# cache database found instance on the way out
+		instance.set_to_cache(ttl=cache_ttl)
+		if imap is not None and find_uuid is not None:
+			imap[(cls, find_uuid)] = instance
+
+		return instance
+
 
 	@classmethod
 	def find_by_uuids(
 		cls,
-		uuids=[],
+		uuids=None,
 		db_driver=None,
 		cache_driver=None,
 		cache_ttl=None
 	):
+		"""
+		Data object batch search method. Finds records for all uuids using a
+		single batched cache roundtrip plus a single batched database query
+		for the cache misses, instead of one query per uuid.
+
+		Args:
+			uuids (list): List of data object uuid strings.
+			db_driver (object): Database driver.
+			cache_driver (object): Cache driver.
+			cache_ttl (int): Cache time-to-live in seconds.
+
+		Returns:
+			(dict) Dictionary mapping uuid -> data object instance (or None if
+				no record was found for a uuid).
+
+		"""
+
+		if uuids is None:
+			uuids = []
 
 		# get drivers
-		db_driver, cache_driver = cls.get_drivers(
+		db_driver, cache_driver = _get_drivers(
+			cls,
 			db_driver=db_driver,
 			cache_driver=cache_driver
 		)
@@ -272,12 +530,13 @@ class BaseDataObject():
 				in uuids_to_instances.values()
 				if inst is not None
 			]
-			cls.set_batch_to_cache(
-				dataobjects=instances_to_be_cached,
-				db_driver=db_driver,
-				cache_driver=cache_driver,
-				ttl=cache_ttl
-			)
+			if len(instances_to_be_cached) > 0:
+				cls.set_batch_to_cache(
+					dataobjects=instances_to_be_cached,
+					db_driver=db_driver,
+					cache_driver=cache_driver,
+					ttl=cache_ttl
+				)
 
 		# return the aggregated cache found and database found instances in a
 		# uuid->instance dictionary
@@ -380,6 +639,14 @@ class BaseDataObject():
 			table_name=self.TABLE_NAME,
 			uuid=self.get_prop(self.UUID_PROPERTY)
 		)
+		# drop any identity-map entry so a deleted record can't be served
+		# again within the same scope
+		imap = _identity_map.get()
+		if imap is not None:
+			imap.pop(
+				(type(self), self.get_prop(self.UUID_PROPERTY)),
+				None
+			)
 		if record_delete_count > 0:
 			self.delete_from_cache()
 			return True
@@ -418,8 +685,11 @@ class BaseDataObject():
 
 		"""
 
-		if prop_name in self.properties:
-			self.properties[prop_name] = prop_value
+		# bind the dict once so the membership check and the write don't each
+		# pay an attribute lookup
+		properties = self.properties
+		if prop_name in properties:
+			properties[prop_name] = prop_value
 			return True
 		else:
 			return False
@@ -453,8 +723,9 @@ class BaseDataObject():
 
 		"""
 
-		if metadata_name in self.metadata:
-			self.metadata[metadata_name] = metadata_value
+		metadata = self.metadata
+		if metadata_name in metadata:
+			metadata[metadata_name] = metadata_value
 			return True
 		else:
 			return False
@@ -479,39 +750,46 @@ class BaseDataObject():
 		cache_driver,
 		records_are_new=False
 	):
+		# resolve drivers once and share the pair across all instances instead
+		# of re-resolving per record in the constructor
+		db_driver, cache_driver = _get_drivers(
+			cls,
+			db_driver=db_driver,
+			cache_driver=cache_driver
+		)
+		metadata_fields = cls.METADATA_FIELDS
 		instances = []
 		for record in records:
 			prop_dict = {}
-			metadata_dict = {}
+			metadata_dict = {
+				cls.CREATED_TS_METADATA: None,
+				cls.UPDATED_TS_METADATA: None
+			}
 			for prop, val in record.items():
-				if prop in cls.METADATA_FIELDS:
+				if prop in metadata_fields:
 					metadata_dict[prop] = val
 				else:
 					prop_dict[prop] = val
-			instance = cls(
-				prop_dict=prop_dict,
-				db_driver=db_driver,
-				cache_driver=cache_driver,
-				metadata_dict=metadata_dict,
-				new_record=records_are_new
-			)
+			# bypass __init__ with direct attribute assignment so per-record
+			# construction is reduced to trivial slot stores
+			instance = cls.__new__(cls)
+			instance.properties = prop_dict
+			instance.metadata = metadata_dict
+			instance.new_record = records_are_new
+			instance.db_driver = db_driver
+			instance.cache_driver = cache_driver
 			instances.append(instance)
 		return instances
 
 
 	@classmethod
 	def get_drivers(cls, db_driver=None, cache_driver=None):
-		# return drivers if they exist otherwise, retrieve from defaults set on
-		# subclass
-		db_driver = (
-			db_driver if db_driver is not None
-			else cls.DEFAULT_DB_DRIVER
-		)
-		cache_driver = (
-			cache_driver if cache_driver is not None
-			else cls.DEFAULT_CACHE_DRIVER
+		# public wrapper around the module-level resolver
+		return _get_drivers(
+			cls,
+			db_driver=db_driver,
+			cache_driver=cache_driver
 		)
-		return db_driver, cache_driver
 
 
 	@classmethod
@@ -523,7 +801,8 @@ class BaseDataObject():
 	):
 
 		# get drivers
-		db_driver, cache_driver = cls.get_drivers(
+		db_driver, cache_driver = _get_drivers(
+			cls,
 			db_driver=db_driver,
 			cache_driver=cache_driver
 		)
@@ -581,11 +860,7 @@ class BaseDataObject():
 
 	@classmethod
 	def construct_cache_key(cls, uuid):
-		cache_key = '{0}_uuid={1}'.format(
-			cls.TABLE_NAME,
-			uuid
-		)
-		return cache_key
+		return _construct_cache_key(cls.TABLE_NAME, uuid)
 
 
 	def set_to_cache(self, ttl=None):
@@ -594,51 +869,46 @@ class BaseDataObject():
 		)
 		cache_value = self.__serialize_instance_for_cache(instance=self)
 		ttl = ttl if ttl is not None else self.DEFAULT_CACHE_TTL
-		return self.cache_driver.set(
+		set_res = self.cache_driver.set(
 			key=cache_key,
 			value=cache_value,
 			ttl=ttl
 		)
+		if set_res:
+			_local_cache_set(cache_key, cache_value, ttl)
+		return set_res
 
 
 	@classmethod
 	def set_batch_to_cache(
 		cls,
 		dataobjects,
-		db_driver,
-		cache_driver,
-		ttl=None,
+		db_driver=None,
+		cache_driver=None,
+		ttl=None
 	):
-		db_driver, cache_driver = cls.get_drivers(
+		db_driver, cache_driver = _get_drivers(
+			cls,
 			db_driver=db_driver,
 			cache_driver=cache_driver
 		)
-		cache_key_to_value = {}
-		cache_key_to_uuid = {}
-		for DO in dataobjects:
-			DO_uuid = DO.get_prop(cls.UUID_PROPERTY)
-			cache_key = cls.construct_cache_key(
-				uuid=DO_uuid
-			)
-			cache_value = cls.__serialize_instance_for_cache(instance=DO)
-			cache_key_to_value[cache_key] = cache_value
-			cache_key_to_uuid[cache_key] = DO_uuid
+		cache_key_to_value, cache_key_to_uuid = cls.__build_cache_batch(
+			dataobjects=dataobjects
+		)
 		ttl = ttl if ttl is not None else cls.DEFAULT_CACHE_TTL
-		cache_driver_res = cache_driver.batch_set(
-			items=cache_key_to_value,
+		return cls.__write_cache_batch(
+			cache_key_to_value=cache_key_to_value,
+			cache_key_to_uuid=cache_key_to_uuid,
+			cache_driver=cache_driver,
 			ttl=ttl
 		)
-		uuid_to_cache_status = {}
-		for cache_key, status in cache_driver_res.items():
-			DO_uuid = cache_key_to_uuid[cache_key]
-			uuid_to_cache_status[DO_uuid] = status
-		return uuid_to_cache_status
 
 
 	def delete_from_cache(self):
 		cache_key = self.construct_cache_key(
 			uuid=self.get_prop(self.UUID_PROPERTY)
 		)
+		_local_cache_delete(cache_key)
 		delete_res = self.cache_driver.delete(cache_key)
 		return True if delete_res == 1 else False
 
@@ -647,10 +917,11 @@ class BaseDataObject():
 	def delete_batch_from_cache(
 		cls,
 		dataobjects,
-		db_driver,
-		cache_driver
+		db_driver=None,
+		cache_driver=None
 	):
-		db_driver, cache_driver = cls.get_drivers(
+		db_driver, cache_driver = _get_drivers(
+			cls,
 			db_driver=db_driver,
 			cache_driver=cache_driver
 		)
@@ -661,6 +932,8 @@ class BaseDataObject():
 			cache_key = cls.construct_cache_key(uuid=uuid)
 			cache_keys.append(cache_key)
 			cache_key_to_uuid[cache_key] = uuid
+		for cache_key in cache_keys:
+			_local_cache_delete(cache_key)
 		batch_delete_res = cache_driver.batch_delete(keys=cache_keys)
 		uuids_to_cache_delete_status = {}
 		for cache_key, delete_count in batch_delete_res.items():
@@ -677,7 +950,8 @@ class BaseDataObject():
 		db_driver,
 		cache_driver
 	):
-		db_driver, cache_driver = cls.get_drivers(
+		db_driver, cache_driver = _get_drivers(
+			cls,
 			db_driver=db_driver,
 			cache_driver=cache_driver
 		)
@@ -685,8 +959,20 @@ class BaseDataObject():
 			cls.construct_cache_key(uuid=uuid): uuid
 			for uuid in uuids
 		}
-		cache_keys = list(cache_keys_to_uuids.keys())
-		cache_keys_to_values = cache_driver.batch_get(keys=cache_keys)
+		# serve what we can from the local cache and only hit the remote
+		# cache for the rest
+		cache_keys_to_values = {}
+		remote_cache_keys = []
+		for cache_key in cache_keys_to_uuids:
+			cached_value = _local_cache_get(cache_key)
+			if cached_value is not None:
+				cache_keys_to_values[cache_key] = cached_value
+			else:
+				remote_cache_keys.append(cache_key)
+		if len(remote_cache_keys) > 0:
+			cache_keys_to_values.update(
+				cache_driver.batch_get(keys=remote_cache_keys)
+			)
 		uuids_to_instances = {
 			cache_keys_to_uuids[cache_key]: cls.__deserialize_value_from_cache(
 				cache_value=cache_value,
@@ -713,6 +999,17 @@ class BaseDataObject():
 	########## UTILITY PUBLIC METHODS ##########
 
 
+	@classmethod
+	def clear_schema_cache(cls):
+		"""
+		Clear the memoized field names for this data object's table (e.g.
+		after a schema migration).
+
+		"""
+
+		_table_field_names.pop(cls.TABLE_NAME, None)
+
+
 	def to_dict(self):
 		"""
 		Get data object's properies and metadata in dictionary format.
@@ -742,9 +1039,12 @@ class BaseDataObject():
 		"""
 
 		if pretty:
-			return json.dumps(self.to_dict(), sort_keys=True, indent=2)
+			return orjson.dumps(
+				self.to_dict(),
+				option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+			).decode()
 		else:
-			return json.dumps(self.to_dict())
+			return orjson.dumps(self.to_dict()).decode()
 
 
 	########## PRIVATE METHODS ##########
@@ -752,15 +1052,12 @@ class BaseDataObject():
 
 	@classmethod
 	def __serialize_instances_for_database(cls, instances):
-		serialized_records = []
-		for inst in instances:
-			serialized_record = {}
-			for m_field, m_value in inst.get_metadatas().items():
-				serialized_record[m_field] = m_value
-			for s_field, s_value in inst.get_properties().items():
-				serialized_record[s_field] = s_value
-			serialized_records.append(serialized_record)
-		return serialized_records
+		# merge metadata and properties in a single C-level dict build per
+		# record (properties win on key collision, as before)
+		return [
+			{ **inst.get_metadatas(), **inst.get_properties() }
+			for inst in instances
+		]
 
 
 	@classmethod
@@ -774,10 +1071,56 @@ class BaseDataObject():
 			return None
 
 
+	@classmethod
+	def __build_cache_batch(cls, dataobjects):
+		# serialize a batch of data objects into the cache_key -> payload and
+		# cache_key -> uuid maps consumed by __write_cache_batch; payloads
+		# contain no live instance state, so the write may be deferred
+		cache_key_to_value = {}
+		cache_key_to_uuid = {}
+		for DO in dataobjects:
+			DO_uuid = DO.get_prop(cls.UUID_PROPERTY)
+			cache_key = cls.construct_cache_key(
+				uuid=DO_uuid
+			)
+			cache_value = cls.__serialize_instance_for_cache(instance=DO)
+			cache_key_to_value[cache_key] = cache_value
+			cache_key_to_uuid[cache_key] = DO_uuid
+		return cache_key_to_value, cache_key_to_uuid
+
+
+	@classmethod
+	def __write_cache_batch(
+		cls,
+		cache_key_to_value,
+		cache_key_to_uuid,
+		cache_driver,
+		ttl
+	):
+		cache_driver_res = cache_driver.batch_set(
+			items=cache_key_to_value,
+			ttl=ttl
+		)
+		uuid_to_cache_status = {}
+		for cache_key, status in cache_driver_res.items():
+			if status:
+				_local_cache_set(cache_key, cache_key_to_value[cache_key], ttl)
+			DO_uuid = cache_key_to_uuid[cache_key]
+			uuid_to_cache_status[DO_uuid] = status
+		return uuid_to_cache_status
+
+
 	@classmethod
 	def __serialize_instances_for_cache(cls, instances):
-		serialized = [ inst.to_dict() for inst in instances ]
-		return serialized
+		# flat [properties, metadata, new_record] payload: serializes to a
+		# JSON array, which is smaller on the wire than the nested to_dict
+		# shape and skips a dict alloc per entry on both sides. The dicts are
+		# copied so the payload shares no live state with the instance and
+		# can be written (or deferred) safely.
+		return [
+			[ dict(inst.properties), dict(inst.metadata), inst.new_record ]
+			for inst in instances
+		]
 
 
 	@classmethod
@@ -796,16 +1139,26 @@ class BaseDataObject():
 		db_driver,
 		cache_driver
 	):
-		deserialized = [
-			cls(
-				prop_dict=val['properties'],
-				db_driver=db_driver,
-				cache_driver=cache_driver,
-				metadata_dict=val['metadata'],
-				new_record=val['new_record']
+		deserialized = []
+		for val in cache_values:
+			if type(val) is dict:
+				# tolerate the legacy nested to_dict payload shape so
+				# entries written before the flat-array format deployed
+				# still read until they age out
+				val = [
+					val['properties'],
+					val['metadata'],
+					val['new_record']
+				]
+			deserialized.append(
+				cls(
+					prop_dict=val[0],
+					db_driver=db_driver,
+					cache_driver=cache_driver,
+					metadata_dict=val[1],
+					new_record=val[2]
+				)
 			)
-			for val in cache_values
-		]
 		return deserialized
 
 
@@ -828,5 +1181,11 @@ class BaseDataObject():
 
 
 	def __get_database_prop_names(self):
-		return self.db_driver.get_table_field_names(self.TABLE_NAME)
+		field_names = _table_field_names.get(self.TABLE_NAME)
+		if field_names is None:
+			field_names = tuple(
+				self.db_driver.get_table_field_names(self.TABLE_NAME)
+			)
+			_table_field_names[self.TABLE_NAME] = field_names
+		return field_names
 
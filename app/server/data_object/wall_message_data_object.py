@@ -15,6 +15,9 @@ class WallMessageDataObject(BaseDataObject):
 	"""
 
 
+	__slots__ = ()
+
+
 	TABLE_NAME = 'wall_message'
 	DEFAULT_DB_DRIVER = MySqlDriver(db_config=MasterMySqlDB.get_instance())
 	DEFAULT_CACHE_DRIVER = RedisDriver(
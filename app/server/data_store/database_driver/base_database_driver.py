@@ -30,6 +30,10 @@ class BaseDatabaseDriver(metaclass=ABCMeta):
 	def find_by_fields(self, table_name, where_props={}, limit=None):
 		pass
 
+	@abstractmethod
+	def find_one_by_fields(self, table_name, where_props={}):
+		pass
+
 	@abstractmethod
 	def update_by_uuid(self, table_name, uuid, value_props={}):
 		pass
@@ -89,8 +89,9 @@ class MySqlDriver(BaseDatabaseDriver):
 			raise RuntimeError("invalid record properties for INSERT")
 
 		# set 'created' and 'updated' record metadata
-		value_props[self.RECORD_CREATED_TS_COLUMN] = self.get_curr_timestamp()
-		value_props[self.RECORD_UPDATED_TS_COLUMN] = self.get_curr_timestamp()
+		current_timestamp = self.get_curr_timestamp()
+		value_props[self.RECORD_CREATED_TS_COLUMN] = current_timestamp
+		value_props[self.RECORD_UPDATED_TS_COLUMN] = current_timestamp
 
 		# gather fields and values for record data
 		fields = []
@@ -211,6 +212,34 @@ class MySqlDriver(BaseDatabaseDriver):
 			return self.db.cur.fetchall()
 
 
+	def find_one_by_fields(self, table_name, where_props={}, order_props={}):
+		"""
+		MySQL driver interface method for finding a single record by
+		conditionals. Issues one LIMIT 1 query and skips result list handling.
+
+		Args:
+			table_name (str): Name of MySQL table.
+			where_props (dict): Dictionary of 'where' clause values where
+				key=column name and value=column value.
+
+		Returns:
+			(dict) Dictionary representing a MySQL record or None if no record
+				matches.
+
+		"""
+
+		records = self.find_by_fields(
+			table_name=table_name,
+			where_props=where_props,
+			order_props=order_props,
+			limit=1
+		)
+		if len(records) > 0:
+			return records[0]
+		else:
+			return None
+
+
 	def update_by_uuid(self, table_name, uuid, value_props={}):
 		"""
 		TODO: method docstring
@@ -108,7 +108,15 @@ test_user_DO = TestUserDataObject.create(prop_dict=user_data)
 ppp("'create' method data object:", test_user_DO.to_dict())
 t.should_be_equal(
 	expected=user_data,
-	actual=test_user_DO.get_properties()
+	actual={
+		key: val for key, val in test_user_DO.get_properties().items()
+		if key != 'uuid'
+	}
+)
+# 'create' should not mutate the caller's dict
+t.should_be_equal(
+	expected=False,
+	actual='uuid' in user_data
 )
 
 